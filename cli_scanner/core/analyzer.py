@@ -21,8 +21,11 @@ handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)
 logger.addHandler(handler)
 
 class OptionsAnalyzer:
-    def __init__(self):
+    def __init__(self, session=None):
         self.warnings_shown = False
+        # Optional HTTP session shared with the scanner so yfinance requests
+        # reuse pooled connections instead of opening their own
+        self.session = session
     
     def filter_dates(self, dates: List[str]) -> List[str]:
         """Filter option expiration dates to those 45+ days out."""
@@ -121,7 +124,7 @@ class OptionsAnalyzer:
             if not ticker:
                 return {"error": "No symbol provided."}
 
-            stock = yf.Ticker(ticker)
+            stock = yf.Ticker(ticker, session=self.session)
             if not stock.options:
                 return {"error": f"No options for {ticker}."}
 
@@ -444,8 +444,8 @@ class EarningsScanner:
         # Default threshold values for IV/RV ratio
         self.iv_rv_pass_threshold = 1.25
         self.iv_rv_near_miss_threshold = 1.0
-        # Initialize the analyzer
-        self.analyzer = OptionsAnalyzer()
+        # Initialize the analyzer on the shared HTTP session
+        self.analyzer = OptionsAnalyzer(session=session)
     
     def _get_combined_earnings_data(self, date: datetime.date) -> List[Dict]:
         """
@@ -188,9 +188,14 @@ def main():
         if recommended or near_misses:
             print("\n=== SCAN RESULTS ===")
             
-            # Get tickers by tier
-            tier1_tickers = [t for t in recommended if stock_metrics[t].get('tier', 1) == 1]
-            tier2_tickers = [t for t in recommended if stock_metrics[t].get('tier', 1) == 2]
+            # Get tickers by tier in a single pass
+            tier1_tickers, tier2_tickers = [], []
+            for t in recommended:
+                tier = stock_metrics[t].get('tier', 1)
+                if tier == 1:
+                    tier1_tickers.append(t)
+                elif tier == 2:
+                    tier2_tickers.append(t)
             
             # Compact output mode
             if args.list:
@@ -5,6 +5,8 @@ Displays Tier 1 and Tier 2 trades with enhanced terminal graphics.
 Updates data automatically every few minutes.
 """
 
+import collections
+import contextlib
 import curses
 import time
 import threading
@@ -12,32 +14,73 @@ import sys
 import os
 import argparse
 import logging
+import queue
+from dataclasses import dataclass
 from datetime import datetime, timedelta
-import io
 
 # Import modules from scanner
 from core.scanner import EarningsScanner
 from utils.logging_utils import setup_logging
 
 # Import UI components
+from ui import colors
 from ui import (
     draw_btop_box,
     calculate_layout,
     draw_ticker_box,
+    format_ticker_lines,
+    prepare_ticker_metrics,
+    pack_ticker_boxes,
+    TICKER_SLOT_WIDTH,
     draw_trade_visualizer,
-    handle_mouse_event
+    get_iron_fly_cached,
+    handle_mouse_event,
+    TickerHitIndex
 )
 
+@dataclass(frozen=True)
+class Snapshot:
+    """Result of one scanner refresh, handed from the update thread to the UI"""
+    tier1: tuple
+    tier2: tuple
+    metrics: dict
+    ts: datetime
+
+class _OutputSink:
+    """Write-only stream that keeps just the most recent non-blank writes"""
+    
+    def __init__(self, maxlen=200):
+        self._buf = collections.deque(maxlen=maxlen)
+    
+    def write(self, text):
+        if text.strip():
+            self._buf.append(text)
+        return len(text)
+    
+    def flush(self):
+        pass
+    
+    def getvalue(self):
+        return ''.join(self._buf)
+
 class TradeMonitor:
-    def __init__(self, refresh_rate=300, use_all_sources=False):
+    def __init__(self, refresh_rate=300, use_all_sources=False, workers=0):
         self.refresh_rate = refresh_rate  # seconds between updates
         self.use_all_sources = use_all_sources
+        self.workers = workers  # scanner worker threads (0 = sequential)
         self.scanner = EarningsScanner()
-        self.tier1_tickers = []
-        self.tier2_tickers = []
+        self.tier1_tickers = ()
+        self.tier2_tickers = ()
         self.stock_metrics = {}
+        # Formatted ticker box lines, rebuilt only after a data update
+        self._render_cache = {}
         self.last_update = None
+        # Latest unread scanner result; the update thread replaces any
+        # snapshot the UI has not picked up yet
+        self._snapshots = queue.Queue(maxsize=1)
         self.stop_event = threading.Event()
+        # Wakes the update thread early for a forced refresh or shutdown
+        self.wake_event = threading.Event()
         self.logger = logging.getLogger(__name__)
         
         # Define which boxes are visible (BTOP-like toggles)
@@ -59,52 +102,98 @@ class TradeMonitor:
         self.selected_ticker = None
         self.trade_data = None
         
+        # Curses sub-windows for each panel, created on first layout
+        self._windows = {}
+        # Where the last redraw put each ticker box, for mouse hit-testing
+        self._hit_index = TickerHitIndex()
+        
+        # Text attribute for the status line, resolved once curses colors exist
+        self._status_attr = curses.A_BOLD
+        # Status line currently on screen, so unchanged text is not rewritten
+        self._last_status_str = None
+        
+    @contextlib.contextmanager
+    def _capture_output(self, label):
+        """Send stdout/stderr to a bounded sink and log what was kept at debug level"""
+        # Only redirect if not already redirected elsewhere, so the fetch
+        # thread and the UI thread never restore each other's streams
+        if sys.stdout is not sys.__stdout__:
+            yield
+            return
+        
+        sink = _OutputSink()
+        try:
+            with contextlib.redirect_stdout(sink), contextlib.redirect_stderr(sink):
+                yield
+        finally:
+            captured = sink.getvalue()
+            if captured:
+                self.logger.debug(f"{label}: {captured}")
+    
     def fetch_data(self):
         """Fetch latest scanner data"""
         try:
             self.logger.info("Fetching scanner data...")
             
             # Capture scanner output to prevent it from messing up the UI
-            with io.StringIO() as capture_buffer:
-                original_stdout = sys.stdout
-                original_stderr = sys.stderr
+            with self._capture_output("Scanner output"):
+                # Get scanner data
+                recommended, _, stock_metrics = self.scanner.scan_earnings(
+                    workers=self.workers,
+                    all_sources=self.use_all_sources
+                )
                 
-                # Only redirect if not already redirected elsewhere
-                if sys.stdout == sys.__stdout__:
-                    sys.stdout = capture_buffer
-                    sys.stderr = capture_buffer
-                    local_redirect = True
-                else:
-                    local_redirect = False
-                
-                try:
-                    # Get scanner data
-                    recommended, _, stock_metrics = self.scanner.scan_earnings(
-                        all_sources=self.use_all_sources
-                    )
-                    
-                    # Sort tickers by tier
-                    self.tier1_tickers = [t for t in recommended if stock_metrics[t].get('tier', 1) == 1]
-                    self.tier2_tickers = [t for t in recommended if stock_metrics[t].get('tier', 1) == 2]
-                    self.stock_metrics = stock_metrics
-                    
-                finally:
-                    # Always restore original stdout/stderr if we changed them locally
-                    if local_redirect:
-                        sys.stdout = original_stdout
-                        sys.stderr = original_stderr
-                        
-                        # Log any captured output at debug level
-                        captured_output = capture_buffer.getvalue()
-                        if captured_output.strip():
-                            self.logger.debug(f"Scanner output: {captured_output}")
+                # Sort tickers by tier in a single pass, deriving the
+                # display-only fields while each ticker's metrics are at hand
+                tier1_tickers, tier2_tickers = [], []
+                for t in recommended:
+                    prepare_ticker_metrics(stock_metrics[t])
+                    tier = stock_metrics[t].get('tier', 1)
+                    if tier == 1:
+                        tier1_tickers.append(t)
+                    elif tier == 2:
+                        tier2_tickers.append(t)
             
-            self.last_update = datetime.now()
-            self.logger.info(f"Data updated. Found {len(self.tier1_tickers)} Tier 1 and {len(self.tier2_tickers)} Tier 2 trades")
+            self._publish(Snapshot(
+                tier1=tuple(tier1_tickers),
+                tier2=tuple(tier2_tickers),
+                metrics=stock_metrics,
+                ts=datetime.now()
+            ))
+            self.logger.info(f"Data updated. Found {len(tier1_tickers)} Tier 1 and {len(tier2_tickers)} Tier 2 trades")
             
         except Exception as e:
             self.logger.error(f"Error fetching data: {str(e)}")
     
+    def _publish(self, snapshot):
+        """Offer a snapshot to the UI, dropping any older one it has not read"""
+        try:
+            self._snapshots.get_nowait()
+        except queue.Empty:
+            pass
+        self._snapshots.put_nowait(snapshot)
+    
+    def _apply_pending_snapshot(self):
+        """Adopt the newest published snapshot on the UI thread, if any"""
+        try:
+            snapshot = self._snapshots.get_nowait()
+        except queue.Empty:
+            return False
+        
+        self.tier1_tickers = snapshot.tier1
+        self.tier2_tickers = snapshot.tier2
+        self.stock_metrics = snapshot.metrics
+        self.last_update = snapshot.ts
+        self._render_cache = {}
+        return True
+    
+    def _ticker_lines(self, ticker, metrics):
+        """Return cached ticker box lines, formatting them on first use"""
+        lines = self._render_cache.get(ticker)
+        if lines is None:
+            lines = self._render_cache[ticker] = format_ticker_lines(metrics)
+        return lines
+    
     def format_time_remaining(self):
         """Format time until next refresh"""
         if not self.last_update:
@@ -120,99 +209,139 @@ class TradeMonitor:
         return f"{minutes:02d}:{seconds:02d}"
     
     def update_countdown(self, stdscr, max_width):
-        """Update just the countdown timer without redrawing the whole screen"""
+        """Update just the countdown timer without redrawing the whole screen
+        
+        Returns True if the status text changed and was rewritten.
+        """
         status_text = f"Last Update: {self.last_update.strftime('%Y-%m-%d %H:%M:%S') if self.last_update else 'Never'} | Next Update: {self.format_time_remaining()}"
+        if status_text == self._last_status_str:
+            return False
+        self._last_status_str = status_text
         
-        # Clear the previous status text by writing spaces
-        blank_text = " " * len(status_text)
+        # Clear the previous status text by blanking the panel's inner row
+        blank_text = " " * (max_width - 2)
         try:
             # Center in the status panel
-            stdscr.addstr(1, 1 + (max_width - len(blank_text)) // 2, blank_text)
-            stdscr.addstr(1, 1 + (max_width - len(status_text)) // 2, status_text, curses.color_pair(10) | curses.A_BOLD)
+            stdscr.addstr(1, 1, blank_text)
+            stdscr.addstr(1, 1 + (max_width - len(status_text)) // 2, status_text, self._status_attr)
         except curses.error:
             pass  # Handle potential out-of-bounds error
+        return True
 
     def update_data_thread(self):
         """Background thread to update data periodically"""
         while not self.stop_event.is_set():
             self.fetch_data()
-            # Sleep in small increments to allow clean shutdown
-            for _ in range(self.refresh_rate):
-                if self.stop_event.is_set():
-                    break
-                time.sleep(1)
+            # Block until the next refresh is due; returns early when woken
+            # for a forced refresh or shutdown
+            self.wake_event.wait(self.refresh_rate)
+            self.wake_event.clear()
 
     def fetch_trade_data(self, ticker):
-        """Fetch iron fly trade data for a specific ticker"""
+        """Fetch iron fly trade data for a specific ticker
+        
+        Results are reused for up to one refresh interval, so re-selecting
+        a ticker does not hit the options API again.
+        """
         try:
-            self.logger.info(f"Fetching iron fly data for {ticker}")
-            
             # Use the same capture approach for trade data
-            with io.StringIO() as capture_buffer:
-                original_stdout = sys.stdout
-                original_stderr = sys.stderr
-                
-                # Only redirect if not already redirected elsewhere
-                if sys.stdout == sys.__stdout__:
-                    sys.stdout = capture_buffer
-                    sys.stderr = capture_buffer
-                    local_redirect = True
-                else:
-                    local_redirect = False
-                
-                try:
-                    # Fetch the trade data
-                    trade_data = self.scanner.calculate_iron_fly_strikes(ticker)
-                    self.trade_data = trade_data
-                finally:
-                    # Always restore original stdout/stderr if we changed them locally
-                    if local_redirect:
-                        sys.stdout = original_stdout
-                        sys.stderr = original_stderr
-                        
-                        # Log any captured output at debug level
-                        captured = capture_buffer.getvalue()
-                        if captured.strip():
-                            self.logger.debug(f"Trade data output: {captured}")
+            with self._capture_output("Trade data output"):
+                trade_data = get_iron_fly_cached(self.scanner, ticker, ttl=self.refresh_rate)
+            self.trade_data = trade_data
             
             return trade_data
         except Exception as e:
             self.logger.error(f"Error fetching iron fly data: {str(e)}")
             return {"error": str(e)}
 
+    def _panel_window(self, name, h, w, y, x):
+        """Return the window for a panel, creating or moving it to fit"""
+        win = self._windows.get(name)
+        if win is None:
+            win = self._windows[name] = curses.newwin(h, w, y, x)
+        elif win.getmaxyx() != (h, w) or win.getbegyx() != (y, x):
+            try:
+                win.resize(h, w)
+                win.mvwin(y, x)
+            except curses.error:
+                # Moving can fail mid-resize; start over with a fresh window
+                win = self._windows[name] = curses.newwin(h, w, y, x)
+        return win
+    
+    def _layout_panels(self, layout):
+        """Map each visible panel in the layout to its positioned window"""
+        panels = {}
+        
+        status = layout['status']
+        if status['visible']:
+            panels['status'] = self._panel_window(
+                'status', status['height'], status['width'], status['y'], status['x']
+            )
+        
+        visualizer = layout['visualizer']
+        if visualizer['visible']:
+            panels['visualizer'] = self._panel_window(
+                'visualizer', visualizer['height'], visualizer['width'], visualizer['y'], visualizer['x']
+            )
+        
+        trades = layout['trades']
+        for name in ('tier1', 'tier2'):
+            panel = trades[name]
+            if panel['visible'] and trades['height'] > 0:
+                panels[name] = self._panel_window(
+                    name, trades['height'], panel['width'], trades['y'], panel['x']
+                )
+        
+        return panels
+    
+    def _populate_tier(self, win, panel, tickers, tier, color, text_color, empty_message):
+        """Place ticker boxes inside a tier panel window, packed across columns"""
+        height, width = win.getmaxyx()
+        
+        if not tickers:
+            win.addstr(height // 2, (width - len(empty_message)) // 2, empty_message, text_color)
+            return
+        
+        # Column offsets are fixed for the layout, so they come precomputed
+        col_x = panel['col_x']
+        
+        # Pack tickers into the shortest column until the panel is full
+        placed = pack_ticker_boxes(tickers, self.stock_metrics, len(col_x), 1, height - 2)
+        top, left = win.getbegyx()
+        for ticker, metrics, col, y in placed:
+            box_height, box_width = draw_ticker_box(
+                win, 
+                y, 
+                col_x[col], 
+                ticker, 
+                metrics, 
+                color, 
+                height, 
+                width, 
+                TICKER_SLOT_WIDTH - 2,
+                lines=self._ticker_lines(ticker, metrics)
+            )
+            
+            # Record the visible part of the box in screen coordinates
+            self._hit_index.add(
+                tier, top + y, left + col_x[col],
+                min(box_height, height - 1 - y), box_width, ticker
+            )
+
     def run(self, stdscr):
         """Main display function using curses"""
         # Set up curses
         curses.start_color()
         curses.use_default_colors()
         curses.curs_set(0)  # Hide cursor
-        stdscr.clear()
-        stdscr.timeout(1000)  # Set getch timeout to 1 second for responsive UI
+        stdscr.erase()
+        stdscr.timeout(200)  # Short getch timeout keeps key and mouse input responsive
         
-        # Define BTOP-like color scheme with TTY theme colors
-        curses.init_pair(1, 2, -1)     # Green for Tier 1 (TTY green)
-        curses.init_pair(2, 3, -1)     # Yellow for Tier 2 (TTY yellow)
-        curses.init_pair(3, 1, -1)     # Red for errors (TTY red)
-        curses.init_pair(4, 6, -1)     # Cyan for headers (TTY cyan)
-        curses.init_pair(5, 7, -1)     # White for text (TTY white)
-        curses.init_pair(6, 8, -1)     # Gray for borders (TTY dark gray)
-        curses.init_pair(7, 5, -1)     # Magenta for accents (TTY magenta)
-        curses.init_pair(8, 8, 0)      # Dark gray for shadows (TTY dark gray bg)
-        curses.init_pair(9, 0, 0)      # Black for background fill (TTY black bg)
-        curses.init_pair(10, 7, -1)    # Light gray for data text (TTY white)
-        curses.init_pair(11, 4, -1)    # Blue for instructions (TTY blue)
+        # Define the color pairs and resolve the shared color attributes
+        colors.init_ui_colors()
         
-        GREEN = curses.color_pair(1)
-        YELLOW = curses.color_pair(2)
-        RED = curses.color_pair(3)
-        CYAN = curses.color_pair(4)
-        WHITE = curses.color_pair(5)
-        BORDER = curses.color_pair(6)
-        MAGENTA = curses.color_pair(7)
-        SHADOW = curses.color_pair(8)
-        FILL = curses.color_pair(9)
-        TEXT = curses.color_pair(10)
-        BLUE = curses.color_pair(11)
+        # Combined attributes used on every tick
+        self._status_attr = colors.TEXT | curses.A_BOLD
         
         # Start data update thread
         update_thread = threading.Thread(target=self.update_data_thread)
@@ -221,10 +350,26 @@ class TradeMonitor:
         
         # Track window size to detect resizes
         last_size = stdscr.getmaxyx()
-        # Track if full redraw is needed
-        full_redraw_needed = True
-        # Track when data was last fetched to know when to redraw
-        last_data_update = self.last_update
+        # Box frames need redrawing after resizes and toggles; contents
+        # need redrawing after data updates
+        struct_dirty = True
+        content_dirty = True
+        # Only the trade visualizer needs redrawing after a ticker click
+        visualizer_dirty = False
+        # Selected ticker, ticker price and size of the visualizer's last
+        # render; cleared whenever the layout changes
+        visualizer_key = None
+        # Trade data dict of the last render, held so it is compared by
+        # identity and never confused with a newer dict
+        visualizer_data = None
+        # Layout from the last full redraw; only resizes and toggles change it,
+        # and both of those force a full redraw first
+        layout = None
+        # Visible panel windows for the current layout, keyed by panel name
+        panels = {}
+        # Monotonic second of the last countdown check; the countdown text
+        # only changes once a second, however often the loop wakes
+        last_second = -1
         
         try:
             while True:
@@ -233,222 +378,145 @@ class TradeMonitor:
                 
                 # Check if terminal was resized or if this is first run
                 if last_size != (max_y, max_x):
-                    full_redraw_needed = True
+                    struct_dirty = True
                     last_size = (max_y, max_x)
                 
                 # Check if data was updated
-                if last_data_update != self.last_update:
-                    full_redraw_needed = True
-                    last_data_update = self.last_update
+                if self._apply_pending_snapshot():
+                    content_dirty = True
                 
                 # Check for minimum size
                 if max_y < 20 or max_x < 80:
-                    stdscr.clear()
-                    stdscr.addstr(0, 0, "Terminal too small. Please resize to at least 80x20.", curses.color_pair(3))
+                    stdscr.erase()
+                    stdscr.addstr(0, 0, "Terminal too small. Please resize to at least 80x20.", colors.RED)
                     stdscr.refresh()
                     time.sleep(1)
                     continue
                 
-                # Do a full redraw if needed
-                if full_redraw_needed:
-                    # Clear screen with background color
-                    stdscr.clear()
+                # Whether stdscr was erased on this pass and must reach the
+                # terminal even if no panel window is staged below
+                screen_dirty = False
+                
+                # Reposition the panel windows after a resize or box toggle
+                if struct_dirty:
+                    # Blank the virtual screen so hidden panels disappear;
+                    # curses only sends the cells that actually changed
+                    stdscr.erase()
+                    stdscr.noutrefresh()
+                    screen_dirty = True
                     
                     # Calculate layout based on which boxes are visible
                     layout = calculate_layout(max_y, max_x, self.visible_boxes, self.height_ratios)
+                    panels = self._layout_panels(layout)
+                    visualizer_key = None  # The screen under every window was erased
                     
-                    # Draw status box if visible
-                    if layout['status']['visible']:
-                        status = layout['status']
-                        draw_btop_box(
-                            stdscr, 
-                            status['y'], 
-                            status['x'], 
-                            status['height'], 
-                            status['width'], 
-                            "status", 
-                            CYAN, 
-                            box_num="1"
-                        )
-                        
-                        # Update status display (progress bar or regular info)
-                        self.update_countdown(stdscr, status['width'])
-                    
-                    # Draw trade visualizer if visible
-                    if layout['visualizer']['visible']:
+                    # Reset the flag; every panel needs its contents redrawn
+                    struct_dirty = False
+                    content_dirty = True
+                
+                # Panel windows redrawn on this pass; only these are staged
+                # for the terminal below
+                touched = set()
+                
+                # Redraw the trade visualizer only when what it shows changed;
+                # re-selecting the ticker already on display, or a data update
+                # that leaves its price alone, does not touch the window
+                if 'visualizer' in panels and (content_dirty or visualizer_dirty):
+                    win = panels['visualizer']
+                    h, w = win.getmaxyx()
+                    selected_price = self.stock_metrics.get(self.selected_ticker, {}).get('price')
+                    render_key = (self.selected_ticker, selected_price, h, w)
+                    if render_key != visualizer_key or self.trade_data is not visualizer_data:
+                        win.erase()
                         self.trade_data = draw_trade_visualizer(
-                            stdscr, 
-                            layout['visualizer'], 
+                            win, 
+                            {'y': 0, 'x': 0, 'height': h, 'width': w}, 
                             self.selected_ticker, 
                             self.trade_data, 
                             self.stock_metrics, 
-                            self.scanner
+                            self.scanner,
+                            ttl=self.refresh_rate
                         )
+                        # Remember the trade data actually drawn, which the
+                        # visualizer may have fetched itself
+                        visualizer_key = render_key
+                        visualizer_data = self.trade_data
+                        touched.add('visualizer')
+                visualizer_dirty = False
+                
+                # Redraw the other panel contents, each into its own window
+                if content_dirty:
+                    # Ticker boxes are about to be placed afresh
+                    self._hit_index.clear()
+                    touched.update(name for name in ('status', 'tier1', 'tier2') if name in panels)
                     
-                    # Draw Tier 1 container if visible
-                    trades = layout['trades']
-                    if trades['tier1']['visible']:
-                        draw_btop_box(
-                            stdscr, 
-                            trades['y'], 
-                            trades['tier1']['x'], 
-                            trades['height'], 
-                            trades['tier1']['width'], 
-                            "tier 1 trades", 
-                            GREEN, 
-                            box_num="2"
-                        )
-                        
-                        # Populate Tier 1 tickers
-                        if self.tier1_tickers:
-                            # Calculate columns based on available width
-                            ticker_width = 38  # Width of each ticker box (36 + 2 padding)
-                            columns = max(1, trades['tier1']['width'] // ticker_width)
-                            
-                            # Setup initial positions
-                            column_positions = []
-                            for col in range(columns):
-                                column_positions.append({
-                                    'x': trades['tier1']['x'] + 1 + (col * ticker_width),
-                                    'y': trades['y'] + 1,
-                                    'next_y': trades['y'] + 1
-                                })
-                            
-                            # Place tickers in columns
-                            for i, ticker in enumerate(self.tier1_tickers):
-                                # Choose column (round-robin)
-                                col_idx = i % columns
-                                col = column_positions[col_idx]
-                                
-                                # Skip if we're out of vertical space
-                                if col['next_y'] >= trades['y'] + trades['height'] - 2:
-                                    continue
-                                
-                                metrics = self.stock_metrics[ticker]
-                                ticker_height, _ = draw_ticker_box(
-                                    stdscr, 
-                                    col['next_y'], 
-                                    col['x'], 
-                                    ticker, 
-                                    metrics, 
-                                    GREEN, 
-                                    max_y, 
-                                    max_x, 
-                                    ticker_width - 2
-                                )
-                                
-                                # Update next y position for this column
-                                col['next_y'] += ticker_height
-                        else:
-                            message = "No Tier 1 trades found"
-                            stdscr.addstr(
-                                trades['y'] + trades['height'] // 2, 
-                                trades['tier1']['x'] + (trades['tier1']['width'] - len(message)) // 2, 
-                                message, 
-                                TEXT
-                            )
+                    # Draw status box if visible
+                    if 'status' in panels:
+                        win = panels['status']
+                        win.erase()
+                        h, w = win.getmaxyx()
+                        draw_btop_box(win, 0, 0, h, w, "status", colors.CYAN, box_num="1")
+                        self._last_status_str = None  # Erased along with the panel
                     
-                    # Draw Tier 2 container if visible
-                    if trades['tier2']['visible']:
-                        draw_btop_box(
-                            stdscr, 
-                            trades['y'], 
-                            trades['tier2']['x'], 
-                            trades['height'], 
-                            trades['tier2']['width'], 
-                            "tier 2 trades", 
-                            YELLOW, 
-                            box_num="3"
-                        )
-                        
-                        # Populate Tier 2 tickers
-                        if self.tier2_tickers:
-                            # Calculate columns based on available width
-                            ticker_width = 38  # Width of each ticker box (36 + 2 padding)
-                            columns = max(1, trades['tier2']['width'] // ticker_width)
-                            
-                            # Setup initial positions
-                            column_positions = []
-                            for col in range(columns):
-                                column_positions.append({
-                                    'x': trades['tier2']['x'] + 1 + (col * ticker_width),
-                                    'y': trades['y'] + 1,
-                                    'next_y': trades['y'] + 1
-                                })
-                            
-                            # Place tickers in columns
-                            for i, ticker in enumerate(self.tier2_tickers):
-                                # Choose column (round-robin)
-                                col_idx = i % columns
-                                col = column_positions[col_idx]
-                                
-                                # Skip if we're out of vertical space
-                                if col['next_y'] >= trades['y'] + trades['height'] - 2:
-                                    continue
-                                
-                                metrics = self.stock_metrics[ticker]
-                                ticker_height, _ = draw_ticker_box(
-                                    stdscr, 
-                                    col['next_y'], 
-                                    col['x'], 
-                                    ticker, 
-                                    metrics, 
-                                    YELLOW, 
-                                    max_y, 
-                                    max_x, 
-                                    ticker_width - 2
-                                )
-                                
-                                # Update next y position for this column
-                                col['next_y'] += ticker_height
-                        else:
-                            message = "No Tier 2 trades found"
-                            stdscr.addstr(
-                                trades['y'] + trades['height'] // 2, 
-                                trades['tier2']['x'] + (trades['tier2']['width'] - len(message)) // 2, 
-                                message, 
-                                TEXT
-                            )
+                    # Draw Tier 1 container and tickers if visible
+                    if 'tier1' in panels:
+                        win = panels['tier1']
+                        win.erase()
+                        h, w = win.getmaxyx()
+                        draw_btop_box(win, 0, 0, h, w, "tier 1 trades", colors.GREEN, box_num="2")
+                        self._populate_tier(win, layout['trades']['tier1'], self.tier1_tickers, 1, colors.GREEN, colors.TEXT, "No Tier 1 trades found")
+                    
+                    # Draw Tier 2 container and tickers if visible
+                    if 'tier2' in panels:
+                        win = panels['tier2']
+                        win.erase()
+                        h, w = win.getmaxyx()
+                        draw_btop_box(win, 0, 0, h, w, "tier 2 trades", colors.YELLOW, box_num="3")
+                        self._populate_tier(win, layout['trades']['tier2'], self.tier2_tickers, 2, colors.YELLOW, colors.TEXT, "No Tier 2 trades found")
                     
                     # Reset the flag
-                    full_redraw_needed = False
-                else:
-                    # Just update the countdown timer if status box is visible
-                    if self.visible_boxes.get('1', True):
-                        # Get the current layout for accurate positioning
-                        layout = calculate_layout(max_y, max_x, self.visible_boxes, self.height_ratios)
-                        status = layout['status']
-                        
-                        # Update status display with progress bar if active
-                        self.update_countdown(stdscr, status['width'])
+                    content_dirty = False
+                
+                # Update the countdown timer if status box is visible
+                now_second = int(time.monotonic())
+                if 'status' in panels and (now_second != last_second or self._last_status_str is None):
+                    last_second = now_second
+                    if self.update_countdown(panels['status'], layout['status']['width']):
+                        touched.add('status')
                 
-                # Refresh the screen
-                stdscr.refresh()
+                # Stage only the panels redrawn on this pass, then send them
+                # to the terminal in one update; a click that changes the
+                # selection stages the visualizer alone, and a pass that
+                # changed nothing skips the terminal entirely; an erased
+                # screen is always sent, so hiding the last panel clears it
+                if touched or screen_dirty:
+                    for name in touched:
+                        panels[name].noutrefresh()
+                    curses.doupdate()
                 
                 # Check for input
                 key = stdscr.getch()
                 if key == ord('q') or key == ord('Q'):
                     break
                 elif key == ord('r') or key == ord('R'):
-                    # Force refresh data
-                    self.fetch_data()
-                    full_redraw_needed = True
+                    # Force refresh data on the update thread so the UI stays
+                    # responsive; new data arrives as a published snapshot
+                    self.wake_event.set()
                 elif key == curses.KEY_RESIZE:
-                    # Terminal was resized
-                    full_redraw_needed = True
+                    # Terminal was resized; sync LINES/COLS and let the next
+                    # pass erase the screen and resize the panel windows
+                    curses.update_lines_cols()
+                    struct_dirty = True
                 # Handle toggling boxes with number keys (1-4)
                 elif key in [ord('1'), ord('2'), ord('3'), ord('4')]:
                     box_key = chr(key)
                     self.visible_boxes[box_key] = not self.visible_boxes[box_key]
-                    full_redraw_needed = True
+                    struct_dirty = True
                 # Handle mouse clicks
                 elif key == curses.KEY_MOUSE:
                     try:
                         event = curses.getmouse()
                         
-                        # Calculate layout for mouse position detection
-                        layout = calculate_layout(max_y, max_x, self.visible_boxes, self.height_ratios)
-                        
                         # Process the mouse event using our utility function
                         selected_ticker, tier = handle_mouse_event(
                             event, 
@@ -457,14 +525,15 @@ class TradeMonitor:
                             layout,
                             self.tier1_tickers,
                             self.tier2_tickers,
-                            self.stock_metrics
+                            self.stock_metrics,
+                            hit_index=self._hit_index
                         )
                         
                         # Update the selected ticker if one was clicked
                         if selected_ticker:
                             self.selected_ticker = selected_ticker
-                            self.trade_data = None  # Reset trade data to force refresh
-                            full_redraw_needed = True
+                            self.trade_data = self.fetch_trade_data(selected_ticker)
+                            visualizer_dirty = True
                             
                     except Exception as e:
                         # Do not display errors from mouse movements
@@ -474,6 +543,7 @@ class TradeMonitor:
         finally:
             # Clean up
             self.stop_event.set()
+            self.wake_event.set()
             update_thread.join(timeout=2)
 
 def main():
@@ -486,6 +556,12 @@ def main():
         type=int,
         default=300
     )
+    parser.add_argument(
+        '--parallel', '-p',
+        help='Number of worker threads for ticker analysis (default: 0, sequential processing)',
+        type=int,
+        default=0
+    )
     parser.add_argument(
         '--no-all-sources',
         help='Disable using all earnings data sources',
@@ -501,7 +577,8 @@ def main():
     # Start the monitor
     monitor = TradeMonitor(
         refresh_rate=args.refresh,
-        use_all_sources=not args.no_all_sources
+        use_all_sources=not args.no_all_sources,
+        workers=args.parallel
     )
     
     try:
@@ -4,17 +4,29 @@ UI components for CLI scanner trade monitor.
 
 from .components import draw_btop_box
 from .layout import calculate_layout
-from .ticker_display import draw_ticker_box
+from .ticker_display import (
+    draw_ticker_box,
+    format_ticker_lines,
+    prepare_ticker_metrics,
+    pack_ticker_boxes,
+    TICKER_SLOT_WIDTH
+)
 from .trade_graph import draw_pnl_graph, calculate_iron_fly_pnl
-from .trade_details import draw_trade_visualizer
-from .mouse_handler import handle_mouse_event
+from .trade_details import draw_trade_visualizer, get_iron_fly_cached
+from .mouse_handler import handle_mouse_event, TickerHitIndex
 
 __all__ = [
     'draw_btop_box',
     'calculate_layout',
     'draw_ticker_box',
+    'format_ticker_lines',
+    'prepare_ticker_metrics',
+    'pack_ticker_boxes',
+    'TICKER_SLOT_WIDTH',
     'draw_pnl_graph',
     'calculate_iron_fly_pnl',
     'draw_trade_visualizer',
-    'handle_mouse_event'
+    'get_iron_fly_cached',
+    'handle_mouse_event',
+    'TickerHitIndex'
 ]
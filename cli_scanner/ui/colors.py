@@ -0,0 +1,52 @@
+"""
+Color scheme for the trade monitor UI.
+
+The attributes below are resolved once by init_ui_colors(); until then they
+are plain 0, because curses.color_pair() only works after curses colors have
+been started.
+"""
+
+import curses
+
+GREEN = 0      # Tier 1, long positions, profit
+YELLOW = 0     # Tier 2
+RED = 0        # Errors, short positions, loss
+CYAN = 0       # Headers
+WHITE = 0      # Text
+BORDER = 0     # Graph frames
+MAGENTA = 0    # Accents
+SHADOW = 0     # Shadows
+FILL = 0       # Background fill
+TEXT = 0       # Data text
+BLUE = 0       # Instructions
+WHITE_BOLD = 0  # Emphasised text
+
+def init_ui_colors():
+    """Define the BTOP-like color pairs and resolve their attributes"""
+    global GREEN, YELLOW, RED, CYAN, WHITE, BORDER, MAGENTA, SHADOW, FILL, TEXT, BLUE, WHITE_BOLD
+    
+    # Define BTOP-like color scheme with TTY theme colors
+    curses.init_pair(1, 2, -1)     # Green for Tier 1 (TTY green)
+    curses.init_pair(2, 3, -1)     # Yellow for Tier 2 (TTY yellow)
+    curses.init_pair(3, 1, -1)     # Red for errors (TTY red)
+    curses.init_pair(4, 6, -1)     # Cyan for headers (TTY cyan)
+    curses.init_pair(5, 7, -1)     # White for text (TTY white)
+    curses.init_pair(6, 8, -1)     # Gray for borders (TTY dark gray)
+    curses.init_pair(7, 5, -1)     # Magenta for accents (TTY magenta)
+    curses.init_pair(8, 8, 0)      # Dark gray for shadows (TTY dark gray bg)
+    curses.init_pair(9, 0, 0)      # Black for background fill (TTY black bg)
+    curses.init_pair(10, 7, -1)    # Light gray for data text (TTY white)
+    curses.init_pair(11, 4, -1)    # Blue for instructions (TTY blue)
+    
+    GREEN = curses.color_pair(1)
+    YELLOW = curses.color_pair(2)
+    RED = curses.color_pair(3)
+    CYAN = curses.color_pair(4)
+    WHITE = curses.color_pair(5)
+    BORDER = curses.color_pair(6)
+    MAGENTA = curses.color_pair(7)
+    SHADOW = curses.color_pair(8)
+    FILL = curses.color_pair(9)
+    TEXT = curses.color_pair(10)
+    BLUE = curses.color_pair(11)
+    WHITE_BOLD = WHITE | curses.A_BOLD
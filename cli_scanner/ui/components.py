@@ -3,100 +3,93 @@ Basic UI components like boxes and labels.
 """
 
 import curses
+import functools
 
-def draw_btop_box(stdscr, y, x, h, w, title="", color=0, box_num=None):
-    """Draw a BTOP-style box with rounded corners and optional box number"""
-    max_y, max_x = stdscr.getmaxyx()
+# Translation table for BTOP-style superscript box numbers
+_SUPERSCRIPT_DIGITS = str.maketrans("0123456789", "⁰¹²³⁴⁵⁶⁷⁸⁹")
+
+# Finished title strings for the monitor's numbered panels
+_TITLES = {
+    (box_num, title): f" {box_num.translate(_SUPERSCRIPT_DIGITS)}{title} "
+    for box_num, title in (
+        ("1", "status"),
+        ("2", "tier 1 trades"),
+        ("3", "tier 2 trades"),
+        ("4", "trade visualizer"),
+    )
+}
+
+@functools.lru_cache(maxsize=64)
+def _horizontal_border(width):
+    """Return a prebuilt horizontal border run of the given width"""
+    return '─' * width
+
+def _put(stdscr, row, col, text, color, last_cell):
+    """
+    Write text that is known to fit in the window.
     
-    # Box drawing characters with ASCII fallbacks
-    try:
-        # Try fancy box characters first
-        tl, tr = '╭', '╮'  # top left, top right 
-        bl, br = '╰', '╯'  # bottom left, bottom right
-        h_line, v_line = '─', '│'  # horizontal, vertical
-        
-    except curses.error:
-        # Fall back to ASCII characters
-        tl, tr = '+', '+'
-        bl, br = '+', '+'
-        h_line, v_line = '-', '|'
-        
-    # Draw the rounded corners and borders with the specified color
-    if y < max_y and x <= max_x:
+    Writing the window's last cell makes curses report an error after
+    drawing the character, so only a write ending there is guarded.
+    """
+    if (row, col + len(text) - 1) == last_cell:
         try:
-            stdscr.addstr(y, x, tl, color)
+            stdscr.addstr(row, col, text, color)
         except curses.error:
             pass
+    else:
+        stdscr.addstr(row, col, text, color)
+
+def draw_btop_box(stdscr, y, x, h, w, title="", color=0, box_num=None):
+    """Draw a BTOP-style box with rounded corners and optional box number"""
+    max_y, max_x = stdscr.getmaxyx()
+    if h < 2 or w < 2 or y >= max_y or x >= max_x:
+        return
     
-    if y < max_y and x + w - 1 < max_x:
-        try:
-            stdscr.addstr(y, x + w - 1, tr, color)
-        except curses.error:
-            pass
+    # Rounded box drawing characters
+    tl, tr = '╭', '╮'  # top left, top right
+    bl, br = '╰', '╯'  # bottom left, bottom right
     
-    if y + h - 1 < max_y and x < max_x:
-        try:
-            stdscr.addstr(y + h - 1, x, bl, color)
-        except curses.error:
-            pass
+    # Work out once which edges fall inside the window
+    right = min(x + w - 1, max_x - 1)
+    bottom = min(y + h - 1, max_y - 1)
+    has_right = right == x + w - 1
+    has_bottom = bottom == y + h - 1
+    # A clipped edge runs through the window's last column or row
+    span = w - 2 if has_right else right - x
+    rows = h - 2 if has_bottom else bottom - y
+    last_cell = (max_y - 1, max_x - 1)
     
-    if y + h - 1 < max_y and x + w - 1 < max_x:
-        try:
-            stdscr.addstr(y + h - 1, x + w - 1, br, color)
-        except curses.error:
-            pass
+    # Top edge
+    _put(stdscr, y, x, tl, color, last_cell)
+    if span > 0:
+        _put(stdscr, y, x + 1, _horizontal_border(span), color, last_cell)
+    if has_right:
+        _put(stdscr, y, right, tr, color, last_cell)
     
-    # Draw horizontal borders
-    for j in range(x + 1, x + w - 1):
-        if j < max_x:
-            if y < max_y:
-                try:
-                    stdscr.addstr(y, j, h_line, color)
-                except curses.error:
-                    pass
-            if y + h - 1 < max_y:
-                try:
-                    stdscr.addstr(y + h - 1, j, h_line, color)
-                except curses.error:
-                    pass
+    # Side edges
+    if rows > 0:
+        stdscr.vline(y + 1, x, curses.ACS_VLINE | color, rows)
+        if has_right:
+            stdscr.vline(y + 1, right, curses.ACS_VLINE | color, rows)
     
-    # Draw vertical borders
-    for i in range(y + 1, y + h - 1):
-        if i < max_y:
-            if x < max_x:
-                try:
-                    stdscr.addstr(i, x, v_line, color)
-                except curses.error:
-                    pass
-            if x + w - 1 < max_x:
-                try:
-                    stdscr.addstr(i, x + w - 1, v_line, color)
-                except curses.error:
-                    pass
+    # Bottom edge
+    if has_bottom:
+        _put(stdscr, bottom, x, bl, color, last_cell)
+        if span > 0:
+            _put(stdscr, bottom, x + 1, _horizontal_border(span), color, last_cell)
+        if has_right:
+            _put(stdscr, bottom, right, br, color, last_cell)
     
     # Add the title if provided
     if title:
-        # If box_num provided, add to title like BTOP does
-        if box_num:
-            superscript_map = {
-                '0': '⁰',
-                '1': '¹',
-                '2': '²',
-                '3': '³',
-                '4': '⁴',
-                '5': '⁵',
-                '6': '⁶',
-                '7': '⁷',
-                '8': '⁸',
-                '9': '⁹'
-            }
-            superscript_box = ''.join(superscript_map.get(ch, ch) for ch in box_num)
-            title_text = f" {superscript_box}{title} "
-        else:
-            title_text = f" {title} "
+        title_text = _TITLES.get((box_num, title))
+        if title_text is None:
+            # If box_num provided, add to title like BTOP does
+            if box_num:
+                superscript_box = box_num.translate(_SUPERSCRIPT_DIGITS)
+                title_text = f" {superscript_box}{title} "
+            else:
+                title_text = f" {title} "
             
-        if len(title_text) < w - 4 and y < max_y and x + 2 < max_x:
-            try:
-                stdscr.addstr(y, x + 2, title_text, color | curses.A_BOLD)
-            except curses.error:
-                pass
+        if len(title_text) < w - 4 and x + 2 + len(title_text) <= right:
+            stdscr.addstr(y, x + 2, title_text, color | curses.A_BOLD)
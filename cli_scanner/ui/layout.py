@@ -2,8 +2,27 @@
 Layout calculations for the trade monitor UI.
 """
 
+import functools
+from .ticker_display import TICKER_SLOT_WIDTH
+
 def calculate_layout(max_y, max_x, visible_boxes, height_ratios):
-    """Calculate box dimensions based on which boxes are visible"""
+    """Calculate box dimensions based on which boxes are visible
+    
+    Results are memoized on the terminal size and box settings, so the
+    returned dict is shared between calls and must not be modified.
+    """
+    return _calculate_layout_cached(
+        max_y,
+        max_x,
+        tuple(sorted(visible_boxes.items())),
+        tuple(sorted(height_ratios.items()))
+    )
+
+@functools.lru_cache(maxsize=32)
+def _calculate_layout_cached(max_y, max_x, visible_items, ratio_items):
+    """Compute the layout from hashable snapshots of the box settings"""
+    visible_boxes = dict(visible_items)
+    height_ratios = dict(ratio_items)
     layout = {}
     
     # Start with fixed positions - reduce status box height
@@ -87,4 +106,10 @@ def calculate_layout(max_y, max_x, visible_boxes, height_ratios):
     elif visible_boxes.get('2', True) and not visible_boxes.get('3', True):
         layout['trades']['tier1']['width'] = max_x
     
+    # Ticker column x offsets within each tier panel
+    for name in ('tier1', 'tier2'):
+        panel = layout['trades'][name]
+        columns = max(1, panel['width'] // TICKER_SLOT_WIDTH)
+        panel['col_x'] = tuple(1 + col * TICKER_SLOT_WIDTH for col in range(columns))
+    
     return layout
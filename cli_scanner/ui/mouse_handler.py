@@ -2,12 +2,70 @@
 Mouse event handling utilities.
 """
 
+import bisect
 import curses
 import logging
+from .ticker_display import pack_ticker_boxes, ticker_box_height, TICKER_SLOT_WIDTH
 
 logger = logging.getLogger(__name__)
 
-def handle_mouse_event(event, max_y, max_x, layout, tier1_tickers, tier2_tickers, stock_metrics):
+class TickerHitIndex:
+    """
+    Screen positions of the ticker boxes drawn in the last frame.
+    
+    Boxes are grouped by column; each column keeps its box start rows in
+    sorted order so a click resolves with one bisect instead of replaying
+    the whole layout.
+    """
+    
+    def __init__(self):
+        # (tier, x, width) -> (sorted y starts, matching (y_end, ticker) pairs)
+        self._columns = {}
+    
+    def clear(self):
+        """Forget every recorded box, ahead of a redraw"""
+        self._columns.clear()
+    
+    def add(self, tier, y, x, height, width, ticker):
+        """Record a drawn ticker box in absolute screen coordinates"""
+        starts, boxes = self._columns.setdefault((tier, x, width), ([], []))
+        i = bisect.bisect_right(starts, y)
+        starts.insert(i, y)
+        boxes.insert(i, (y + height, ticker))
+    
+    def lookup(self, mx, my):
+        """Return (ticker, tier) for the box under (mx, my), or (None, None)"""
+        for (tier, x, width), (starts, boxes) in self._columns.items():
+            if not x <= mx < x + width:
+                continue
+            i = bisect.bisect_right(starts, my) - 1
+            if i >= 0 and my < boxes[i][0]:
+                return boxes[i][1], tier
+        return None, None
+
+def _ticker_at(panel, trades, mx, my, tickers, stock_metrics):
+    """Return the ticker whose box covers (mx, my) in a tier panel, or None"""
+    columns = len(panel['col_x'])
+    column_idx = (mx - panel['x'] - 1) // TICKER_SLOT_WIDTH
+    if not 0 <= column_idx < columns:
+        return None
+    
+    # Replay the renderer's placement; boxes in a column only move down,
+    # so stop at the first box in the clicked column that starts below it
+    top = trades['y'] + 1
+    bottom = trades['y'] + trades['height'] - 2
+    if not top <= my < bottom + 1:
+        return None
+    for ticker, metrics, col, y in pack_ticker_boxes(tickers, stock_metrics, columns, top, bottom):
+        if col != column_idx:
+            continue
+        if y > my:
+            break
+        if my < y + ticker_box_height(metrics):
+            return ticker
+    return None
+
+def handle_mouse_event(event, max_y, max_x, layout, tier1_tickers, tier2_tickers, stock_metrics, hit_index=None):
     """
     Process a mouse click event and determine what was clicked.
     
@@ -17,6 +75,8 @@ def handle_mouse_event(event, max_y, max_x, layout, tier1_tickers, tier2_tickers
         layout: UI layout dictionary
         tier1_tickers, tier2_tickers: Lists of ticker symbols
         stock_metrics: Dictionary of ticker metrics
+        hit_index: Optional TickerHitIndex filled by the last draw; when
+            given, the click is resolved from it instead of the layout
         
     Returns:
         tuple: (selected_ticker, tier) or (None, None) if no ticker was clicked
@@ -25,96 +85,33 @@ def handle_mouse_event(event, max_y, max_x, layout, tier1_tickers, tier2_tickers
         # Unpack mouse event
         _, mx, my, _, _ = event
         
-        selected_ticker = None
-        tier = None
+        if hit_index is not None:
+            selected_ticker, tier = hit_index.lookup(mx, my)
+            if selected_ticker:
+                logger.info(f"Selected ticker: {selected_ticker} from Tier {tier}")
+            return selected_ticker, tier
         
-        # Check if click was in Tier 1 area
-        tier1 = layout['trades']['tier1']
-        if tier1['visible']:
-            if (tier1['x'] <= mx < tier1['x'] + tier1['width'] and
-                layout['trades']['y'] <= my < layout['trades']['y'] + layout['trades']['height']):
-                
-                # Calculate which ticker was clicked
-                ticker_width = 38  # Width of each ticker box (36 + 2 padding)
-                columns = max(1, tier1['width'] // ticker_width)
-                
-                # Determine which column was clicked
-                column_idx = min((mx - tier1['x']) // ticker_width, columns - 1)
-                
-                # Calculate potential ticker positions for this column
-                tickers_in_column = []
-                y_pos = layout['trades']['y'] + 1
-                
-                for ticker in tier1_tickers:
-                    if ticker not in stock_metrics:
-                        continue
-                        
-                    # Only consider tickers that would be in this column
-                    if len(tickers_in_column) % columns == column_idx:
-                        metrics = stock_metrics[ticker]
-                        height = 4  # Base height
-                        if 'float_ratio' in metrics:
-                            height += 1
-                        if 'expected_move_pct' in metrics:
-                            height += 1
-                        
-                        # Check if click is within this ticker's box
-                        if y_pos <= my < y_pos + height:
-                            selected_ticker = ticker
-                            tier = 1
-                            logger.info(f"Selected ticker: {ticker} from Tier 1")
-                            break
-                        
-                        # Update y position for next ticker in this column
-                        y_pos += height
-                    
-                    # Track tickers in all columns to determine column position
-                    tickers_in_column.append(ticker)
+        # Only clicks inside the trades area can hit a ticker
+        trades = layout['trades']
+        if not trades['y'] <= my < trades['y'] + trades['height']:
+            return None, None
         
-        # Check if click was in Tier 2 area
-        tier2 = layout['trades']['tier2']
-        if tier2['visible'] and not selected_ticker:  # Only check if we haven't found a ticker yet
-            if (tier2['x'] <= mx < tier2['x'] + tier2['width'] and
-                layout['trades']['y'] <= my < layout['trades']['y'] + layout['trades']['height']):
-                
-                # Similar logic for tier 2
-                ticker_width = 30  # Width of each ticker box (28 + 2 padding)
-                columns = max(1, tier2['width'] // ticker_width)
-                
-                # Determine which column was clicked
-                column_idx = min((mx - tier2['x']) // ticker_width, columns - 1)
-                
-                # Calculate potential ticker positions for this column
-                tickers_in_column = []
-                y_pos = layout['trades']['y'] + 1
-                
-                for ticker in tier2_tickers:
-                    if ticker not in stock_metrics:
-                        continue
-                        
-                    # Only consider tickers that would be in this column
-                    if len(tickers_in_column) % columns == column_idx:
-                        metrics = stock_metrics[ticker]
-                        height = 4  # Base height
-                        if 'float_ratio' in metrics:
-                            height += 1
-                        if 'expected_move_pct' in metrics:
-                            height += 1
-                        
-                        # Check if click is within this ticker's box
-                        if y_pos <= my < y_pos + height:
-                            selected_ticker = ticker
-                            tier = 2
-                            logger.info(f"Selected ticker: {ticker} from Tier 2")
-                            break
-                        
-                        # Update y position for next ticker in this column
-                        y_pos += height
-                    
-                    # Track tickers in all columns to determine column position
-                    tickers_in_column.append(ticker)
+        # Check each visible tier panel in turn, stopping at the first hit
+        tiers = (
+            ('tier1', 1, tier1_tickers),
+            ('tier2', 2, tier2_tickers),
+        )
+        for tier_key, tier, tickers in tiers:
+            panel = trades[tier_key]
+            if not panel['visible'] or not panel['x'] <= mx < panel['x'] + panel['width']:
+                continue
+            
+            selected_ticker = _ticker_at(panel, trades, mx, my, tickers, stock_metrics)
+            if selected_ticker:
+                logger.info(f"Selected ticker: {selected_ticker} from Tier {tier}")
+                return selected_ticker, tier
         
-        return selected_ticker, tier
+        return None, None
         
     except Exception as e:
         logger.debug(f"Error processing mouse event: {e}")
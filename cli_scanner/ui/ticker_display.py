@@ -2,61 +2,126 @@
 Ticker display components for the trade monitor.
 """
 
-import curses
+from . import colors
 from .components import draw_btop_box
 
-def draw_ticker_box(stdscr, y, x, ticker, metrics, color, max_y, max_x, width=40):
-    """Draw a box containing ticker information in BTOP style"""
-    ticker_width = 36
+# Ticker boxes have a fixed width; each column slot adds two cells of padding
+TICKER_BOX_WIDTH = 36
+TICKER_SLOT_WIDTH = TICKER_BOX_WIDTH + 2
+
+# Line templates for the fixed set of metrics shown in every ticker box
+_PRICE_VOL_FMT = "Price: ${price:.2f} | Vol: {volume:,.0f}"
+_IV_RV_FMT = "IV/RV: {iv_rv_ratio:.2f} | Term: {term_structure:.3f}"
+_WINRATE_FMT = "Winrate: {win_rate:.1f}% over {win_quarters} earnings"
+_EXPECTED_MOVE_FMT = "EM: {:.1f}% (${:.2f}-${:.2f})"
+
+def _fit(line, ticker_width):
+    """Truncate a line with an ellipsis if it is too long for the box"""
+    if len(line) > ticker_width - 2:
+        return line[:ticker_width - 5] + "..."
+    return line
+
+def prepare_ticker_metrics(metrics):
+    """
+    Store the derived layout and expected-move fields on a ticker's metrics dict.
+    
+    Called once when scanner results arrive, so redraws read the box
+    height and expected-move string instead of recomputing them.
+    """
+    metrics['_box_height'] = _box_height(metrics)
+    
+    em_pct = metrics.get('expected_move_pct')
+    if em_pct is None:
+        return metrics
+    
+    price = metrics['price']
+    # Only derive the dollar move when the scanner did not supply it
+    em_dollars = metrics.get('expected_move_dollars')
+    if em_dollars is None:
+        em_dollars = price * em_pct / 100
     
+    # Expected price range
+    metrics['_em_info_str'] = _EXPECTED_MOVE_FMT.format(
+        em_pct, price - em_dollars, price + em_dollars
+    )
+    return metrics
+
+def format_ticker_lines(metrics, ticker_width=TICKER_BOX_WIDTH):
+    """Build the metric lines shown inside a ticker box, truncated to fit"""
+    lines = [
+        _fit(_PRICE_VOL_FMT.format_map(metrics), ticker_width),
+        _fit(_IV_RV_FMT.format_map(metrics), ticker_width),
+        _fit(_WINRATE_FMT.format_map(metrics), ticker_width)
+    ]
+    
+    # Add expected move information - more compact
+    if metrics.get('expected_move_pct') is not None:
+        if '_em_info_str' not in metrics:
+            prepare_ticker_metrics(metrics)
+        lines.append(_fit(metrics['_em_info_str'], ticker_width))
+    
+    return lines
+
+def _box_height(metrics):
+    """Count the rows a ticker box needs: frame, three metric lines and optional extras"""
     height = 5
     if 'float_ratio' in metrics:
         height += 1
     if 'expected_move_pct' in metrics:
         height += 1
+    return height
+
+def ticker_box_height(metrics):
+    """Return the number of rows a ticker box needs for these metrics"""
+    height = metrics.get('_box_height')
+    if height is None:
+        height = _box_height(metrics)
+    return height
+
+def pack_ticker_boxes(tickers, stock_metrics, columns, top, bottom):
+    """
+    Assign ticker boxes to columns, always filling the shortest column first.
+    
+    Yields (ticker, metrics, column, y) for each box that starts above bottom.
+    Drawing and mouse hit-testing both use this so they agree on placement.
+    """
+    next_y = [top] * columns
+    for ticker in tickers:
+        metrics = stock_metrics.get(ticker)
+        if metrics is None:
+            continue
+        
+        col = min(range(columns), key=next_y.__getitem__)
+        y = next_y[col]
+        # Every column is full once the shortest one is
+        if y >= bottom:
+            break
+        
+        yield ticker, metrics, col, y
+        next_y[col] = y + ticker_box_height(metrics)
+
+def draw_ticker_box(stdscr, y, x, ticker, metrics, color, max_y, max_x, width=40, lines=None):
+    """Draw a box containing ticker information in BTOP style
+    
+    lines may hold the output of format_ticker_lines() from an earlier frame
+    so unchanged metrics are not re-formatted on every redraw.
+    """
+    ticker_width = TICKER_BOX_WIDTH
+    height = ticker_box_height(metrics)
+    
+    if lines is None:
+        lines = format_ticker_lines(metrics, ticker_width)
     
     # Draw the main ticker box
     draw_btop_box(stdscr, y, x, height, ticker_width, ticker, color)
     
     # Display metrics with padding - reduce padding
     y_pos = y + 1
-    
-    if y_pos < max_y - 1:
-        price_vol = f"Price: ${metrics['price']:.2f} | Vol: {metrics['volume']:,.0f}"
-        # Truncate if too long for the box
-        if len(price_vol) > ticker_width - 2:
-            price_vol = price_vol[:ticker_width - 5] + "..."
-        stdscr.addstr(y_pos, x + 1, price_vol, curses.color_pair(10))
-    
-    y_pos += 1
-    if y_pos < max_y - 1:
-        iv_rv = f"IV/RV: {metrics['iv_rv_ratio']:.2f} | Term: {metrics['term_structure']:.3f}"
-        if len(iv_rv) > ticker_width - 2:
-            iv_rv = iv_rv[:ticker_width - 5] + "..."
-        stdscr.addstr(y_pos, x + 1, iv_rv, curses.color_pair(10))
-    
-    y_pos += 1
-    if y_pos < max_y - 1:
-        winrate = f"Winrate: {metrics['win_rate']:.1f}% over {metrics['win_quarters']} earnings"
-        if len(winrate) > ticker_width - 2:
-            winrate = winrate[:ticker_width - 5] + "..."
-        stdscr.addstr(y_pos, x + 1, winrate, curses.color_pair(10))
-    
-    # Add expected move information - more compact
-    y_pos += 1
-    if y_pos < max_y - 1 and 'expected_move_pct' in metrics:
-        current_price = metrics['price']
-        em_pct = metrics['expected_move_pct']
-        em_dollars = metrics.get('expected_move_dollars', current_price * em_pct / 100)
-        
-        # Calculate expected price range
-        lower_price = current_price - em_dollars
-        upper_price = current_price + em_dollars
-        
-        em_info = f"EM: {em_pct:.1f}% (${lower_price:.2f}-${upper_price:.2f})"
-        if len(em_info) > ticker_width - 2:
-            em_info = em_info[:ticker_width - 5] + "..."
-        stdscr.addstr(y_pos, x + 1, em_info, curses.color_pair(10))
+    for line in lines:
+        if y_pos >= max_y - 1:
+            break
+        stdscr.addstr(y_pos, x + 1, line, colors.TEXT)
+        y_pos += 1
     
     # Return the height of this ticker box for positioning the next one
     # and the width for multi-column layout
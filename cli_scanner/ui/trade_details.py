@@ -2,15 +2,117 @@
 Trade details display components.
 """
 
+import collections
 import curses
 import logging
+import time
+from . import colors
 from .components import draw_btop_box
 from .trade_graph import draw_pnl_graph
 
 logger = logging.getLogger(__name__)
 
-def draw_trade_visualizer(stdscr, box_data, selected_ticker, trade_data, stock_metrics, scanner):
-    """Draw the trade visualizer box with iron fly visualization"""
+# Recent iron fly results per ticker as (fetched_at, trade_data), kept in
+# least-recently-used order
+_iron_fly_cache = collections.OrderedDict()
+_IRON_FLY_CACHE_SIZE = 32
+_iron_fly_stats = {'hits': 0, 'misses': 0}
+
+# Iron fly legs as (name, strike key, premium key, color name in ui.colors):
+# green for long positions, red for short
+POSITIONS = (
+    ("Long Put", "long_put_strike", "long_put_premium", "GREEN"),
+    ("Short Put", "short_put_strike", "short_put_premium", "RED"),
+    ("Short Call", "short_call_strike", "short_call_premium", "RED"),
+    ("Long Call", "long_call_strike", "long_call_premium", "GREEN"),
+)
+
+# Trade fields the P&L graph does arithmetic on
+_GRAPH_FIELDS = (
+    "long_put_strike", "short_put_strike", "short_call_strike", "long_call_strike",
+    "net_credit", "max_profit", "max_risk",
+)
+
+def _normalize_trade_numbers(trade_data):
+    """
+    Convert the graph's numeric fields to native floats once, when a result is fetched.
+    
+    Returns False if any field could not be converted.
+    """
+    converted = True
+    for key in _GRAPH_FIELDS:
+        if key in trade_data:
+            try:
+                trade_data[key] = float(trade_data[key])
+            except (TypeError, ValueError):
+                converted = False
+    return converted
+
+def get_iron_fly_cached(scanner, ticker, ttl=300):
+    """Return scanner.calculate_iron_fly_strikes(ticker), reusing results younger than ttl seconds"""
+    now = time.monotonic()
+    hit = _iron_fly_cache.get(ticker)
+    if hit and now - hit[0] < ttl:
+        _iron_fly_cache.move_to_end(ticker)
+        _iron_fly_stats['hits'] += 1
+        logger.debug(f"Iron fly cache hit for {ticker} (hits={_iron_fly_stats['hits']}, misses={_iron_fly_stats['misses']})")
+        return hit[1]
+    
+    _iron_fly_stats['misses'] += 1
+    logger.info(f"Fetching iron fly data for {ticker}")
+    logger.debug(f"Iron fly cache miss for {ticker} (hits={_iron_fly_stats['hits']}, misses={_iron_fly_stats['misses']})")
+    trade_data = scanner.calculate_iron_fly_strikes(ticker)
+    
+    # Only cache usable results so failures are retried on the next request
+    if trade_data and "error" not in trade_data and _normalize_trade_numbers(trade_data):
+        _iron_fly_cache[ticker] = (now, trade_data)
+        _iron_fly_cache.move_to_end(ticker)
+        while len(_iron_fly_cache) > _IRON_FLY_CACHE_SIZE:
+            _iron_fly_cache.popitem(last=False)
+    
+    return trade_data
+
+def _draw_positions_and_metrics(stdscr, start_y, start_x, trade_data, box_data):
+    """Write the iron fly legs and trade metrics as a column of lines inside the box"""
+    bottom = box_data['y'] + box_data['height'] - 1
+    y_pos = start_y
+    
+    # Display the positions, colored by side
+    for name, strike_key, premium_key, color_name in POSITIONS:
+        if y_pos < bottom:
+            position_text = f"{name}: Strike ${trade_data.get(strike_key, 'N/A')}, Premium ${trade_data.get(premium_key, 'N/A')}"
+            try:
+                stdscr.addstr(y_pos, start_x, position_text, getattr(colors, color_name))
+            except curses.error:
+                pass
+            y_pos += 1
+    
+    y_pos += 1
+    
+    # Show trade metrics
+    metrics = [
+        f"Net Credit: ${trade_data.get('net_credit', 'N/A')}",
+        f"Max Profit: ${trade_data.get('max_profit', 'N/A')}",
+        f"Max Risk: ${trade_data.get('max_risk', 'N/A')}",
+        f"Break-even: ${trade_data.get('lower_breakeven', 'N/A')} - ${trade_data.get('upper_breakeven', 'N/A')}",
+        f"Risk:Reward: {trade_data.get('risk_reward_ratio', 'N/A')}:1"
+    ]
+    
+    for metric in metrics:
+        if y_pos < bottom:
+            try:
+                stdscr.addstr(y_pos, start_x, metric, colors.TEXT)
+            except curses.error:
+                pass
+            y_pos += 1
+
+def draw_trade_visualizer(stdscr, box_data, selected_ticker, trade_data, stock_metrics, scanner, ttl=300):
+    """
+    Draw the trade visualizer box with iron fly visualization.
+    
+    A missing trade is fetched through the iron fly cache, treating results
+    older than ttl seconds as stale.
+    """
     # Draw the container box
     draw_btop_box(
         stdscr, 
@@ -19,7 +121,7 @@ def draw_trade_visualizer(stdscr, box_data, selected_ticker, trade_data, stock_m
         box_data['height'], 
         box_data['width'], 
         "trade visualizer", 
-        curses.color_pair(4),  # Cyan color for header
+        colors.CYAN,  # Cyan color for header
         box_num="4"
     )
     
@@ -31,7 +133,7 @@ def draw_trade_visualizer(stdscr, box_data, selected_ticker, trade_data, stock_m
                 box_data['y'] + box_data['height'] // 2,
                 box_data['x'] + (box_data['width'] - len(msg)) // 2,
                 msg,
-                curses.color_pair(10)
+                colors.TEXT
             )
         except curses.error:
             pass
@@ -40,8 +142,7 @@ def draw_trade_visualizer(stdscr, box_data, selected_ticker, trade_data, stock_m
     # If we have a selected ticker but no trade data, fetch it
     if not trade_data:
         try:
-            logger.info(f"Fetching iron fly data for {selected_ticker}")
-            trade_data = scanner.calculate_iron_fly_strikes(selected_ticker)
+            trade_data = get_iron_fly_cached(scanner, selected_ticker, ttl=ttl)
         except Exception as e:
             logger.error(f"Error fetching iron fly data: {str(e)}")
             trade_data = {"error": str(e)}
@@ -54,7 +155,7 @@ def draw_trade_visualizer(stdscr, box_data, selected_ticker, trade_data, stock_m
                 box_data['y'] + box_data['height'] // 2,
                 box_data['x'] + (box_data['width'] - len(error_msg)) // 2,
                 error_msg,
-                curses.color_pair(3)  # Red for errors
+                colors.RED  # Red for errors
             )
         except curses.error:
             pass
@@ -68,7 +169,7 @@ def draw_trade_visualizer(stdscr, box_data, selected_ticker, trade_data, stock_m
     # Show ticker and expiration
     ticker_header = f"{selected_ticker} Iron Fly - Exp: {trade_data.get('expiration', 'N/A')}"
     try:
-        stdscr.addstr(y_pos, x_pos, ticker_header, curses.color_pair(5) | curses.A_BOLD)
+        stdscr.addstr(y_pos, x_pos, ticker_header, colors.WHITE_BOLD)
     except curses.error:
         pass
     
@@ -81,13 +182,18 @@ def draw_trade_visualizer(stdscr, box_data, selected_ticker, trade_data, stock_m
     # Get iron fly parameters for graph
     try:
         current_price = float(stock_metrics[selected_ticker]['price'])
-        long_put_strike = float(trade_data.get("long_put_strike", 0))
-        short_put_strike = float(trade_data.get("short_put_strike", 0))
-        short_call_strike = float(trade_data.get("short_call_strike", 0))
-        long_call_strike = float(trade_data.get("long_call_strike", 0))
-        net_credit = float(trade_data.get("net_credit", 0))
-        max_profit = float(trade_data.get("max_profit", 0))
-        max_loss = float(trade_data.get("max_risk", 0))
+        # Numeric fields were converted to floats when the result was fetched;
+        # any left unconverted send the panel to the text-only layout below
+        unconverted = [key for key in _GRAPH_FIELDS if not isinstance(trade_data.get(key, 0.0), (int, float))]
+        if unconverted:
+            raise ValueError(f"non-numeric trade fields: {', '.join(unconverted)}")
+        long_put_strike = trade_data.get("long_put_strike", 0.0)
+        short_put_strike = trade_data.get("short_put_strike", 0.0)
+        short_call_strike = trade_data.get("short_call_strike", 0.0)
+        long_call_strike = trade_data.get("long_call_strike", 0.0)
+        net_credit = trade_data.get("net_credit", 0.0)
+        max_profit = trade_data.get("max_profit", 0.0)
+        max_loss = trade_data.get("max_risk", 0.0)
         
         # Draw the PnL graph
         draw_pnl_graph(
@@ -106,128 +212,12 @@ def draw_trade_visualizer(stdscr, box_data, selected_ticker, trade_data, stock_m
             max_loss
         )
         
-        # Position for trade details (to the right of the graph)
-        details_x = x_pos + graph_width + 4
-        details_y = y_pos
-        
-        # Show positions with appropriate colors
-        positions = [
-            {
-                "name": "Long Put",
-                "strike": trade_data.get("long_put_strike", "N/A"),
-                "premium": trade_data.get("long_put_premium", "N/A"),
-                "color": curses.color_pair(1)  # Green for long
-            },
-            {
-                "name": "Short Put",
-                "strike": trade_data.get("short_put_strike", "N/A"),
-                "premium": trade_data.get("short_put_premium", "N/A"),
-                "color": curses.color_pair(3)  # Red for short
-            },
-            {
-                "name": "Short Call",
-                "strike": trade_data.get("short_call_strike", "N/A"),
-                "premium": trade_data.get("short_call_premium", "N/A"),
-                "color": curses.color_pair(3)  # Red for short
-            },
-            {
-                "name": "Long Call",
-                "strike": trade_data.get("long_call_strike", "N/A"),
-                "premium": trade_data.get("long_call_premium", "N/A"),
-                "color": curses.color_pair(1)  # Green for long
-            }
-        ]
-        
-        # Display the positions next to the graph
-        for position in positions:
-            if details_y < box_data['y'] + box_data['height'] - 1:
-                position_text = f"{position['name']}: Strike ${position['strike']}, Premium ${position['premium']}"
-                try:
-                    stdscr.addstr(details_y, details_x, position_text, position["color"])
-                except curses.error:
-                    pass
-                details_y += 1
-        
-        details_y += 1
-        
-        # Show trade metrics
-        metrics = [
-            f"Net Credit: ${trade_data.get('net_credit', 'N/A')}",
-            f"Max Profit: ${trade_data.get('max_profit', 'N/A')}",
-            f"Max Risk: ${trade_data.get('max_risk', 'N/A')}",
-            f"Break-even: ${trade_data.get('lower_breakeven', 'N/A')} - ${trade_data.get('upper_breakeven', 'N/A')}",
-            f"Risk:Reward: {trade_data.get('risk_reward_ratio', 'N/A')}:1"
-        ]
-        
-        for metric in metrics:
-            if details_y < box_data['y'] + box_data['height'] - 1:
-                try:
-                    stdscr.addstr(details_y, details_x, metric, curses.color_pair(10))
-                except curses.error:
-                    pass
-                details_y += 1
+        # Show trade details to the right of the graph
+        _draw_positions_and_metrics(stdscr, y_pos, x_pos + graph_width + 4, trade_data, box_data)
                 
     except Exception as e:
         # Fallback to old display method if there's an error with the graph
         logger.error(f"Error drawing PnL graph: {str(e)}")
-        
-        y_pos += 1
-        
-        # Show positions with appropriate colors
-        positions = [
-            {
-                "name": "Long Put",
-                "strike": trade_data.get("long_put_strike", "N/A"),
-                "premium": trade_data.get("long_put_premium", "N/A"),
-                "color": curses.color_pair(1)  # Green for long
-            },
-            {
-                "name": "Short Put",
-                "strike": trade_data.get("short_put_strike", "N/A"),
-                "premium": trade_data.get("short_put_premium", "N/A"),
-                "color": curses.color_pair(3)  # Red for short
-            },
-            {
-                "name": "Short Call",
-                "strike": trade_data.get("short_call_strike", "N/A"),
-                "premium": trade_data.get("short_call_premium", "N/A"),
-                "color": curses.color_pair(3)  # Red for short
-            },
-            {
-                "name": "Long Call",
-                "strike": trade_data.get("long_call_strike", "N/A"),
-                "premium": trade_data.get("long_call_premium", "N/A"),
-                "color": curses.color_pair(1)  # Green for long
-            }
-        ]
-        
-        # Display the positions
-        for position in positions:
-            if y_pos < box_data['y'] + box_data['height'] - 1:
-                position_text = f"{position['name']}: Strike ${position['strike']}, Premium ${position['premium']}"
-                try:
-                    stdscr.addstr(y_pos, x_pos, position_text, position["color"])
-                except curses.error:
-                    pass
-                y_pos += 1
-        
-        y_pos += 1
-        
-        # Show trade metrics
-        metrics = [
-            f"Net Credit: ${trade_data.get('net_credit', 'N/A')}",
-            f"Max Profit: ${trade_data.get('max_profit', 'N/A')}",
-            f"Max Risk: ${trade_data.get('max_risk', 'N/A')}",
-            f"Break-even: ${trade_data.get('lower_breakeven', 'N/A')} - ${trade_data.get('upper_breakeven', 'N/A')}",
-            f"Risk:Reward: {trade_data.get('risk_reward_ratio', 'N/A')}:1"
-        ]
-        
-        for metric in metrics:
-            if y_pos < box_data['y'] + box_data['height'] - 1:
-                try:
-                    stdscr.addstr(y_pos, x_pos, metric, curses.color_pair(10))
-                except curses.error:
-                    pass
-                y_pos += 1
+        _draw_positions_and_metrics(stdscr, y_pos + 1, x_pos, trade_data, box_data)
     
     return trade_data
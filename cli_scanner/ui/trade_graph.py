@@ -3,80 +3,126 @@ Graph rendering components for visualizing iron fly P&L.
 """
 
 import curses
+import functools
 import logging
+import numpy as np
+from . import colors
 
 logger = logging.getLogger(__name__)
 
+# Indexes into the attribute table built by draw_pnl_graph; _BLANK marks
+# empty cells, which are never written
+_FRAME, _TEXT, _GREEN, _RED, _CURRENT, _BLANK = range(6)
+
+# Line glyph and color for each entry of draw_pnl_graph's price_points:
+# green for long strikes, red for short strikes, dotted for the current price
+_PRICE_POINT_STYLES = (
+    ("│", _GREEN),
+    ("│", _RED),
+    ("┊", _CURRENT),
+    ("│", _RED),
+    ("│", _GREEN),
+)
+
+@functools.lru_cache(maxsize=16)
+def _frame_parts(height, width):
+    """
+    Return the empty graph frame as (chars, slots) grids for a graph size.
+    
+    The arrays are shared between calls and marked read-only; callers
+    copy them before drawing into them.
+    """
+    chars = np.full((height, width), ord(" "), dtype="<u4")
+    slots = np.full((height, width), _FRAME, dtype=np.uint8)
+    
+    # Draw the graph frame
+    chars[0, :] = chars[-1, :] = ord("─")
+    chars[:, 0] = chars[:, -1] = ord("│")
+    chars[0, 0], chars[0, -1] = ord("┌"), ord("┐")
+    chars[-1, 0], chars[-1, -1] = ord("└"), ord("┘")
+    
+    # X-axis label (Price)
+    x_label = "Price"
+    label_x = width // 2 - len(x_label) // 2
+    if 0 <= label_x and label_x + len(x_label) <= width:
+        chars[-1, label_x:label_x + len(x_label)] = [ord(c) for c in x_label]
+        slots[-1, label_x:label_x + len(x_label)] = _TEXT
+    
+    chars.flags.writeable = slots.flags.writeable = False
+    return chars, slots
+
+def _iron_fly_legs(short_put_strike, short_call_strike, long_put_strike, long_call_strike, net_credit):
+    """
+    Validate iron fly inputs and put the strikes in order.
+    
+    Returns (short_put_strike, short_call_strike, put_width, call_width),
+    or None if the inputs cannot describe a trade.
+    """
+    strikes = (long_put_strike, short_put_strike, short_call_strike, long_call_strike)
+    if not all(isinstance(v, (int, float)) for v in strikes + (net_credit,)):
+        return None
+    if min(strikes) <= 0:
+        return None
+    
+    # Ensure strikes are in the correct order
+    long_put_strike, short_put_strike, short_call_strike, long_call_strike = sorted(strikes)
+    
+    # Calculate width of spreads
+    put_width = short_put_strike - long_put_strike
+    call_width = long_call_strike - short_call_strike
+    return short_put_strike, short_call_strike, put_width, call_width
+
+def _iron_fly_pnl_fast(price, short_put_strike, short_call_strike, net_credit, put_width, call_width):
+    """
+    Iron fly P&L for a price or a NumPy array of prices, with no validation.
+    
+    Max profit between the short strikes; losses grow past them and are
+    capped by the spread widths at the long strikes.
+    """
+    put_loss = np.clip(short_put_strike - price, 0, put_width)
+    call_loss = np.clip(price - short_call_strike, 0, call_width)
+    return net_credit - put_loss - call_loss
+
 def calculate_iron_fly_pnl(price, short_put_strike, short_call_strike, long_put_strike, long_call_strike, net_credit):
     """Calculate the P&L of an iron fly at a given price"""
     try:
         # Validate inputs to prevent calculation errors
-        if not all(isinstance(x, (int, float)) for x in 
-                [price, short_put_strike, short_call_strike, long_put_strike, long_call_strike, net_credit]):
+        if not isinstance(price, (int, float)) or price <= 0:
             return 0
-        
-        if price <= 0 or short_put_strike <= 0 or short_call_strike <= 0 or long_put_strike <= 0 or long_call_strike <= 0:
+        legs = _iron_fly_legs(short_put_strike, short_call_strike, long_put_strike, long_call_strike, net_credit)
+        if legs is None:
             return 0
         
-        # Ensure strikes are in the correct order
-        if not (long_put_strike <= short_put_strike <= short_call_strike <= long_call_strike):
-            # Attempt to correct the order if possible
-            strikes = sorted([long_put_strike, short_put_strike, short_call_strike, long_call_strike])
-            long_put_strike, short_put_strike, short_call_strike, long_call_strike = strikes
-        
-        # Calculate width of spreads
-        put_width = short_put_strike - long_put_strike
-        call_width = long_call_strike - short_call_strike
-        
-        # For an iron fly:
-        # - Max profit at price = short strikes (typically ATM)
-        # - Loss increases as price moves away from short strikes
-        # - Loss capped by the long strikes
-        
-        if price <= long_put_strike:
-            # Below the long put strike - max loss
-            pnl = net_credit - put_width
-        elif price < short_put_strike:
-            # Between long put and short put - partial loss
-            pnl = net_credit - (short_put_strike - price)
-        elif price <= short_call_strike:
-            # Between short put and short call - max profit
-            pnl = net_credit
-        elif price < long_call_strike:
-            # Between short call and long call - partial loss
-            pnl = net_credit - (price - short_call_strike)
-        else:
-            # Above the long call strike - max loss
-            pnl = net_credit - call_width
-        
-        return pnl
+        short_put_strike, short_call_strike, put_width, call_width = legs
+        return float(_iron_fly_pnl_fast(price, short_put_strike, short_call_strike,
+                                        net_credit, put_width, call_width))
     except Exception as e:
         logger.error(f"Error calculating PnL: {str(e)}")
         return 0
 
+def _iron_fly_pnl_curve(prices, short_put_strike, short_call_strike, long_put_strike, long_call_strike, net_credit):
+    """Evaluate calculate_iron_fly_pnl over an array of prices, validating the strikes once"""
+    legs = _iron_fly_legs(short_put_strike, short_call_strike, long_put_strike, long_call_strike, net_credit)
+    if legs is None:
+        return np.zeros_like(prices)
+    
+    short_put_strike, short_call_strike, put_width, call_width = legs
+    pnl = _iron_fly_pnl_fast(prices, short_put_strike, short_call_strike, net_credit, put_width, call_width)
+    # Non-positive prices have no meaningful P&L, as in the scalar version
+    return np.where(prices > 0, pnl, 0.0)
+
 def draw_pnl_graph(stdscr, y, x, height, width, current_price, long_put_strike, 
                  short_put_strike, short_call_strike, long_call_strike, 
                  net_credit, max_profit, max_loss):
-    """Draw a text-based P&L graph for the iron fly strategy"""
+    """
+    Draw a text-based P&L graph for the iron fly strategy.
+    
+    The graph area must already be blank; empty cells are left untouched.
+    """
     try:
-        # Draw the graph frame
-        # Top border
-        stdscr.addstr(y, x, "┌" + "─" * (width - 2) + "┐", curses.color_pair(6))
-        
-        # Side borders and fill content area
-        for i in range(1, height - 1):
-            stdscr.addstr(y + i, x, "│" + " " * (width - 2) + "│", curses.color_pair(6))
-        
-        # Bottom border
-        stdscr.addstr(y + height - 1, x, "└" + "─" * (width - 2) + "┘", curses.color_pair(6))
-        
         # Y-axis label (P&L)
         if x > 5:
-            stdscr.addstr(y, x - 5, "P&L", curses.color_pair(10))
-        
-        # X-axis label (Price)
-        x_label = "Price"
-        stdscr.addstr(y + height - 1, x + (width // 2) - (len(x_label) // 2), x_label, curses.color_pair(10))
+            stdscr.addstr(y, x - 5, "P&L", colors.TEXT)
         
         # Calculate price range for x-axis - ensure we have a meaningful range
         min_price = min(long_put_strike, short_put_strike) * 0.9
@@ -106,14 +152,24 @@ def draw_pnl_graph(stdscr, y, x, height, width, current_price, long_put_strike,
         
         pnl_range = max_pnl - min_pnl
         
+        # The graph is composed in a character grid plus a parallel grid of
+        # indexes into attrs, then written out one addstr per colour run
+        attrs = (
+            colors.BORDER,      # _FRAME
+            colors.TEXT,        # _TEXT
+            colors.GREEN,       # _GREEN
+            colors.RED,         # _RED
+            colors.WHITE_BOLD,  # _CURRENT
+        )
+        # Start from the cached frame and axis label for this size
+        frame_chars, frame_slots = _frame_parts(height, width)
+        chars, slots = frame_chars.copy(), frame_slots.copy()
+        
         # Draw the zero P&L line
         if min_pnl < 0 < max_pnl:
             zero_y = int(y + height - 2 - ((0 - min_pnl) / pnl_range) * (height - 3))
             if y < zero_y < y + height - 1:
-                try:
-                    stdscr.addstr(zero_y, x + 1, "─" * (width - 2), curses.color_pair(6))
-                except curses.error:
-                    pass
+                chars[zero_y - y, 1:-1] = ord("─")
         
         # Sample price points across the width of the graph
         num_samples = width - 4
@@ -127,8 +183,16 @@ def draw_pnl_graph(stdscr, y, x, height, width, current_price, long_put_strike,
             long_call_strike
         ]
         
+        # Style each price point line by its position in price_points; a short
+        # strike that equals a long strike (a sparse chain can put a wing on
+        # its short strike) shares the long position's green line
+        styles = list(_PRICE_POINT_STYLES)
+        for short in (1, 3):
+            if price_points[short] in (long_put_strike, long_call_strike):
+                styles[short] = _PRICE_POINT_STYLES[0]
+        
         # Draw vertical lines at important price points
-        for price in price_points:
+        for price, (line_char, line_color) in zip(price_points, styles):
             # Skip if price is outside our graph range
             if price < min_price or price > max_price:
                 continue
@@ -141,67 +205,67 @@ def draw_pnl_graph(stdscr, y, x, height, width, current_price, long_put_strike,
             
             # Ensure x_pos is within bounds
             if x < x_pos < x + width - 1:
-                # Draw a vertical line at strike prices
-                for i in range(1, height - 1):
+                chars[1:-1, x_pos - x] = ord(line_char)
+                slots[1:-1, x_pos - x] = line_color
+        
+        # Pre-calculate all PnL values and their rows in one vectorized pass
+        sample_prices = np.linspace(min_price, max_price, num_samples)
+        sample_pnls = _iron_fly_pnl_curve(sample_prices, short_put_strike, short_call_strike,
+                                          long_put_strike, long_call_strike, net_credit)
+        sample_ys = (y + height - 2 - ((sample_pnls - min_pnl) / pnl_range) * (height - 3)).astype(int)
+        
+        # Graph-relative columns at or next to a price point line; connecting
+        # segments skip them
+        strike_xs = {int(x + 1 + ((p - min_price) / price_range) * (width - 4)) - x for p in price_points}
+        forbidden = {xc + d for xc in strike_xs for d in (-1, 0, 1)}
+        
+        # Only samples that land inside the frame are plotted
+        rows = sample_ys - y
+        cols = np.arange(num_samples) + 2
+        plotted = np.flatnonzero((rows > 0) & (rows < height - 1) & (cols < width - 1))
+        plotted_rows = rows[plotted]
+        
+        # Connect consecutive plotted points that are more than a row apart,
+        # without overwriting the vertical price point lines
+        for k in np.flatnonzero(np.abs(np.diff(plotted_rows)) > 1).tolist():
+            col = int(plotted[k + 1]) + 1
+            if col in forbidden:
+                continue
+            lo, hi = sorted((int(plotted_rows[k]), int(plotted_rows[k + 1])))
+            chars[lo + 1:hi, col] = ord("┊")
+            slots[lo + 1:hi, col] = _TEXT
+        
+        # Plot the curve, colored by profit/loss
+        plotted_pnls = sample_pnls[plotted]
+        chars[plotted_rows, cols[plotted]] = ord("•")
+        slots[plotted_rows, cols[plotted]] = np.where(
+            plotted_pnls > 0, _GREEN, np.where(plotted_pnls < 0, _RED, _TEXT)
+        )
+        
+        # Draw each side of the frame with one vline call
+        try:
+            stdscr.vline(y + 1, x, curses.ACS_VLINE | attrs[_FRAME], height - 2)
+            stdscr.vline(y + 1, x + width - 1, curses.ACS_VLINE | attrs[_FRAME], height - 2)
+        except curses.error:
+            pass
+        
+        # Emit each row as one write per run of the same color, skipping
+        # runs of blank cells; rows between the top and bottom edges stop
+        # short of the sides
+        runs = np.where(chars == ord(" "), _BLANK, slots)
+        for r in range(height):
+            lo, hi = (0, width) if r in (0, height - 1) else (1, width - 1)
+            text = chars[r].tobytes().decode("utf-32-le")
+            row_runs = runs[r, lo:hi]
+            start = 0
+            for end in (np.flatnonzero(row_runs[1:] != row_runs[:-1]) + 1).tolist() + [hi - lo]:
+                slot = row_runs[start]
+                if slot != _BLANK:
                     try:
-                        if price in [long_put_strike, long_call_strike]:
-                            stdscr.addstr(y + i, x_pos, "│", curses.color_pair(1))  # Green for long positions
-                        elif price in [short_put_strike, short_call_strike]:
-                            stdscr.addstr(y + i, x_pos, "│", curses.color_pair(3))  # Red for short positions
-                        else:
-                            # Current price
-                            stdscr.addstr(y + i, x_pos, "┊", curses.color_pair(5) | curses.A_BOLD)
+                        stdscr.addstr(y + r, x + lo + start, text[lo + start:lo + end], attrs[slot])
                     except curses.error:
                         pass
-        
-        # Pre-calculate all PnL values for smoother drawing
-        sample_prices = []
-        sample_pnls = []
-        
-        for i in range(num_samples):
-            price = min_price + (i / (num_samples - 1)) * price_range
-            sample_prices.append(price)
-            pnl = calculate_iron_fly_pnl(price, short_put_strike, short_call_strike, 
-                                              long_put_strike, long_call_strike, net_credit)
-            sample_pnls.append(pnl)
-        
-        # Draw the P&L curve
-        prev_y_pnl = None
-        for i, (price, pnl) in enumerate(zip(sample_prices, sample_pnls)):
-            # Calculate the y position
-            y_pnl = None
-            try:
-                y_pnl = int(y + height - 2 - ((pnl - min_pnl) / pnl_range) * (height - 3))
-            except (ZeroDivisionError, ValueError):
-                continue
-            
-            # Ensure y_pnl is within bounds
-            if y < y_pnl < y + height - 1 and x + i + 2 < x + width - 1:
-                try:
-                    char = "•"
-                    
-                    # Draw a line to connect points if possible
-                    if prev_y_pnl is not None and i > 0:
-                        # If points are far apart, connect them with a line
-                        if abs(prev_y_pnl - y_pnl) > 1:
-                            step = 1 if prev_y_pnl < y_pnl else -1
-                            for line_y in range(prev_y_pnl + step, y_pnl, step):
-                                if y < line_y < y + height - 1:
-                                    # Ensure we're not overwriting a vertical strike line
-                                    if not any(abs(x + i + 1 - int(x + 1 + ((p - min_price) / price_range) * (width - 4))) < 2 for p in price_points):
-                                        stdscr.addstr(line_y, x + i + 1, "┊", curses.color_pair(10))
-                    
-                    # Color based on profit/loss
-                    if pnl > 0:
-                        stdscr.addstr(y_pnl, x + i + 2, char, curses.color_pair(1))  # Green for profit
-                    elif pnl < 0:
-                        stdscr.addstr(y_pnl, x + i + 2, char, curses.color_pair(3))  # Red for loss
-                    else:
-                        stdscr.addstr(y_pnl, x + i + 2, char, curses.color_pair(10))  # White for breakeven
-                    
-                    prev_y_pnl = y_pnl
-                except curses.error:
-                    pass
+                start = end
         
         # Draw P&L values on y-axis (only at min, 0, and max)
         pnl_values = [min_pnl, 0, max_pnl]
@@ -218,7 +282,7 @@ def draw_pnl_graph(stdscr, y, x, height, width, current_price, long_put_strike,
             if y < y_pos < y + height - 1 and x > 7:
                 try:
                     pnl_label = f"${pnl:.2f}"
-                    stdscr.addstr(y_pos, x - len(pnl_label) - 1, pnl_label, curses.color_pair(10))
+                    stdscr.addstr(y_pos, x - len(pnl_label) - 1, pnl_label, colors.TEXT)
                 except curses.error:
                     pass
             